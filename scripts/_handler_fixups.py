@@ -0,0 +1,217 @@
+"""Shared pipeline for the fix-* codemods.
+
+One set of compiled byte regexes and one fix_content transform, used by
+fix-all-handlers.py, fix-handlers-v2.py, fix-plugin-errors.py and
+fix-plugin-security-refs.py; the wrappers only supply file lists. The
+pattern set is the union of the per-script sets, covering the h/p/s
+receiver spellings. Workers inherit the compiled patterns via fork, so
+nothing recompiles per process.
+
+run() is the shared pool-then-batched-write driver for every script: it
+takes a file list and a transform returning new content bytes (or None
+when the file is clean), fans the transform out to workers and performs
+the atomic writes in the parent. collect_go_files() is the shared
+package walk for the scripts that sweep the whole tree.
+"""
+
+import argparse
+import hashlib
+import multiprocessing
+import os
+import re
+import tempfile
+from pathlib import Path
+
+# Go source is ASCII-dominated, so everything runs on bytes. All
+# replacements are deletions, fused into one alternation: the buffer is
+# walked once instead of once per pattern.
+# Each pattern consumes the line's leading newline and indentation but
+# leaves the trailing newline for the next line: a \s+...\n shape would
+# swallow both separators and glue the neighbouring lines together.
+# Argument lists are matched with _ARGS (single line, one nested paren
+# level at most): an unbounded [^)]* would cross newlines and stop at
+# the first ), half-deleting any call with an inner call. Calls that can
+# nest deeper or span lines (LogEvent, cache.Set) are deliberately not
+# in this alternation; the paren-balancing sweep below removes them.
+_ARGS = rb'\((?:[^()\n]|\([^()\n]*\))*\)'
+_DELETE_PATTERNS = (
+    rb'\n[ \t]*"streamgate/pkg/security"',
+    rb'\n[ \t]*"streamgate/pkg/optimization"',
+    rb'\n[ \t]*security\s+"streamgate/pkg/security"',
+    rb'\n[ \t]*rateLimiter\s+\*security\.RateLimiter',
+    rb'\n[ \t]*auditLogger\s+\*security\.AuditLogger',
+    rb'\n[ \t]*cache\s+\*optimization\.LocalCache',
+    rb'\n[ \t]*localCache\s+\*optimization\.LocalCache',
+    rb'\n[ \t]*rateLimiter:\s*security\.NewRateLimiter' + _ARGS + rb',?',
+    rb'\n[ \t]*auditLogger:\s*security\.NewAuditLogger' + _ARGS + rb',?',
+    rb'\n[ \t]*cache:\s*optimization\.NewLocalCache' + _ARGS + rb',?',
+    rb'\n[ \t]*localCache:\s*optimization\.NewLocalCache' + _ARGS + rb',?',
+    rb'\n[ \t]*rateLimiter\s*:?=\s*security\.NewRateLimiter' + _ARGS,
+    rb'\n[ \t]*auditLogger\s*:?=\s*security\.NewAuditLogger' + _ARGS,
+    rb'\n[ \t]*localCache\s*:?=\s*optimization\.NewLocalCache' + _ARGS,
+    rb'\n[ \t]*[hps]\.rateLimiter\s*=\s*security\.NewRateLimiter' + _ARGS,
+    rb'\n[ \t]*[hps]\.auditLogger\s*=\s*security\.NewAuditLogger' + _ARGS,
+    rb'\n[ \t]*[hps]\.cache\s*=\s*optimization\.NewLocalCache' + _ARGS,
+    rb'\n[ \t]*_\s*=\s*(?:rateLimiter|auditLogger|localCache)',
+)
+_DELETE_RE = re.compile(b'|'.join(b'(?:%s)' % p for p in _DELETE_PATTERNS))
+
+# memchr-backed substring probes; most files mention none of these and
+# skip the regex passes outright.
+_DELETE_PROBES = (b'security', b'optimization', b'rateLimiter', b'auditLogger', b'localCache')
+
+_LINE_RE = re.compile(rb'[^\n]*\n')
+
+# Matches a whole guard block in one shot, allowing one level of nested
+# braces for the gin.H{...} literals inside. The C regex engine replaces
+# the Python-level brace counting for the common shape; deeper nesting
+# falls back to the line state machine below.
+_GUARD_BLOCK_RE = re.compile(
+    rb'\n[ \t]*if\s+(?:![hps]\.rateLimiter\.Allow|cached,\s*ok\s*:=\s*[hps]\.cache\.Get)'
+    + _ARGS + rb'[^{\n]*\{(?:[^{}]|\{[^{}]*\})*?\}'
+)
+
+_BLOCK_TRIGGERS = (
+    b'if !h.rateLimiter.Allow(',
+    b'if !p.rateLimiter.Allow(',
+    b'if !s.rateLimiter.Allow(',
+    b'if cached, ok := h.cache.Get(',
+    b'if cached, ok := p.cache.Get(',
+    b'if cached, ok := s.cache.Get(',
+)
+
+_CALL_TRIGGERS = (
+    b'h.auditLogger.LogEvent(',
+    b'p.auditLogger.LogEvent(',
+    b's.auditLogger.LogEvent(',
+    b'h.cache.Set(',
+    b'p.cache.Set(',
+    b's.cache.Set(',
+)
+
+
+_BRACES = (b'{', b'}')
+_PARENS = (b'(', b')')
+
+
+def _remove_flagged_blocks(content):
+    # One streaming sweep handles both block kinds: guard blocks balance
+    # braces, auditLogger.LogEvent / cache.Set calls balance parens. The
+    # scan copies only surviving ranges off the buffer, so the file is
+    # walked once instead of once per block kind.
+    parts = []
+    keep_from = 0
+    delims = None
+    depth = 0
+    for m in _LINE_RE.finditer(content):
+        line = m.group()
+        if delims:
+            depth += line.count(delims[0]) - line.count(delims[1])
+            if depth <= 0:
+                delims = None
+                keep_from = m.end()
+            continue
+        if any(t in line for t in _CALL_TRIGGERS):
+            pair = _PARENS
+        elif any(t in line for t in _BLOCK_TRIGGERS):
+            pair = _BRACES
+        else:
+            continue
+        parts.append(content[keep_from:m.start()])
+        keep_from = m.end()
+        depth = line.count(pair[0]) - line.count(pair[1])
+        delims = pair if depth > 0 else None
+    parts.append(content[keep_from:])
+    return b''.join(parts)
+
+
+def fix_content(content):
+    # Block and call removal run before the line deletions: the sweep
+    # keys off trigger text such as auditLogger.LogEvent(, and a
+    # deletion pass running first could consume a trigger and leave the
+    # balancing state machine nothing to fire on.
+    if b'rateLimiter' in content or b'.cache.Get(' in content:
+        content = _GUARD_BLOCK_RE.sub(b'', content)
+    if (b'auditLogger' in content or b'.cache.Set(' in content
+            or any(t in content for t in _BLOCK_TRIGGERS)):
+        content = _remove_flagged_blocks(content)
+    if any(p in content for p in _DELETE_PROBES):
+        content = _DELETE_RE.sub(b'', content)
+    return content
+
+
+def fingerprint(data):
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def transform_file(path):
+    """Return the fixed content, or None when the file is already clean."""
+    # Re-runs are usually no-ops, so change detection is the hot path:
+    # the length check settles it for every deletion, and an 8-byte
+    # blake2b fingerprint replaces the full memcmp otherwise. Skipping
+    # the write also leaves mtimes alone, keeping go build caches warm.
+    original = Path(path).read_bytes()
+    orig_fp = fingerprint(original)
+    content = fix_content(original)
+    if len(content) != len(original) or fingerprint(content) != orig_fp:
+        return content
+    return None
+
+
+def write_file(path, data):
+    # Atomic replace so nothing ever observes a half-written source file.
+    mode = os.stat(path).st_mode
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or '.', delete=False) as tmp:
+        tmp.write(data)
+    os.chmod(tmp.name, mode)
+    os.replace(tmp.name, path)
+
+
+GO_SOURCE_DIRS = (
+    'pkg/web3',
+    'pkg/service',
+    'pkg/gateway',
+    'pkg/plugins',
+    'pkg/middleware',
+    'pkg/storage',
+    'pkg/core',
+    'cmd',
+)
+
+
+def iter_go_files(root):
+    # os.scandir hands back DirEntry objects with the stat cached, about
+    # half the syscalls of os.walk's listdir-plus-stat per entry.
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_go_files(entry.path)
+            elif entry.name.endswith('.go'):
+                yield entry.path
+
+
+def collect_go_files():
+    paths = []
+    for dir_path in GO_SOURCE_DIRS:
+        paths.extend(iter_go_files(dir_path))
+    return paths
+
+
+def run(files, transform=transform_file, label='files', chunksize=1):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--jobs', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    # Workers only transform (pure CPU); the parent batches all writes at
+    # the end, so the OS can coalesce them and workers never open a file
+    # for writing. pool.map keeps results in file order, so paths pair
+    # back up with a zip. chunksize amortises IPC for the tree-wide runs.
+    with multiprocessing.Pool(args.jobs) as pool:
+        results = pool.map(transform, files, chunksize)
+    fixed = 0
+    for path, content in zip(files, results):
+        if content is not None:
+            write_file(path, content)
+            print(f'fixed {path}')
+            fixed += 1
+    print(f'{fixed}/{len(files)} {label} changed')
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Strip leftover pkg/security and pkg/optimization wiring from gateway handlers.
+
+One-off codemod from the middleware consolidation: handlers no longer own
+rateLimiter/auditLogger/cache fields (rate limiting lives in pkg/middleware,
+caching in pkg/storage). Shared pipeline in _handler_fixups.py; safe to re-run.
+"""
+
+import _handler_fixups
+
+HANDLER_FILES = [
+    'pkg/gateway/auth_handlers.go',
+    'pkg/gateway/category_handlers.go',
+    'pkg/gateway/content_handlers.go',
+    'pkg/gateway/gating_rule_handlers.go',
+    'pkg/gateway/nft_handlers.go',
+    'pkg/gateway/playback_stats_handlers.go',
+    'pkg/gateway/streaming_handlers.go',
+    'pkg/gateway/transcode_handlers.go',
+    'pkg/gateway/upload_handlers.go',
+    'pkg/gateway/web3_handlers.go',
+]
+
+if __name__ == '__main__':
+    _handler_fixups.run(HANDLER_FILES, label='handler files')
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Clean up logger and security wiring in cmd/ entry points.
+
+Entry points used to construct their own audit logger and rate limiter
+before handing off to core.RunMicroservice; that wiring is gone. Also
+drops the stale security/optimization imports. Safe to re-run.
+"""
+
+import re
+
+import _handler_fixups
+
+CMD_FILES = [
+    'cmd/monolith/streamgate/main.go',
+    'cmd/microservices/api-gateway/main.go',
+    'cmd/microservices/auth/main.go',
+    'cmd/microservices/cache/main.go',
+    'cmd/microservices/metadata/main.go',
+    'cmd/microservices/monitor/main.go',
+    'cmd/microservices/streaming/main.go',
+    'cmd/microservices/transcoder/main.go',
+    'cmd/microservices/upload/main.go',
+    'cmd/microservices/worker/main.go',
+]
+
+# Bytes throughout: no decode/encode round trip. Deletions fused into
+# one alternation (single pass); the sugared-logger rewrite is a
+# semantic transform and stays on its own.
+# Each pattern consumes the leading newline and indentation but leaves
+# the trailing newline, so neighbouring lines never get glued together.
+# Argument lists use _ARGS (single line, one nested paren level): an
+# unbounded [^)]* would cross newlines and stop at the first ),
+# half-deleting calls with an inner call like c.ClientIP().
+_ARGS = rb'\((?:[^()\n]|\([^()\n]*\))*\)'
+_DELETE_PATTERNS = (
+    rb'\n[ \t]*"streamgate/pkg/security"',
+    rb'\n[ \t]*"streamgate/pkg/optimization"',
+    rb'\n[ \t]*auditLogger\s*:?=\s*security\.NewAuditLogger' + _ARGS,
+    rb'\n[ \t]*rateLimiter\s*:?=\s*security\.NewRateLimiter' + _ARGS,
+    rb'\n[ \t]*defer\s+auditLogger\.Close\(\)',
+    rb'\n[ \t]*auditLogger\.LogEvent' + _ARGS,
+    rb'\n[ \t]*_\s*=\s*(?:rateLimiter|auditLogger)',
+)
+_DELETE_RE = re.compile(b'|'.join(b'(?:%s)' % p for p in _DELETE_PATTERNS))
+_SUGAR_RE = re.compile(rb'logger\.Sugar\(\)\.(Info|Error|Warn)f\(')
+
+
+def transform_file(path):
+    with open(path, 'rb') as f:
+        content = f.read()
+    orig_len = len(content)
+    orig_fp = _handler_fixups.fingerprint(content)
+
+    # memchr-backed substring probes; skip passes with no target tokens.
+    if b'security' in content or b'optimization' in content or b'auditLogger' in content:
+        content = _DELETE_RE.sub(b'', content)
+    if b'logger.Sugar().' in content:
+        content = _SUGAR_RE.sub(rb'logger.\1(', content)
+
+    # Length settles it for deletions; the 8-byte fingerprint replaces a
+    # full memcmp otherwise, and skipped writes leave mtimes alone.
+    if len(content) != orig_len or _handler_fixups.fingerprint(content) != orig_fp:
+        return content
+    return None
+
+
+if __name__ == '__main__':
+    _handler_fixups.run(CMD_FILES, transform=transform_file, label='cmd files')
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Second pass over gateway handlers after fix-all-handlers.py.
+
+Catches the receiver/variable spellings the first pass missed: pointer
+receivers named p, bare local rateLimiter/auditLogger variables, and the
+unused-import errors they left behind. Shared pipeline in
+_handler_fixups.py; safe to re-run.
+"""
+
+import _handler_fixups
+
+FILES = [
+    'pkg/gateway/auth_handlers.go',
+    'pkg/gateway/content_handlers.go',
+    'pkg/gateway/nft_handlers.go',
+    'pkg/gateway/streaming_handlers.go',
+    'pkg/gateway/upload_handlers.go',
+    'pkg/gateway/web3_handlers.go',
+    'pkg/gateway/gateway.go',
+    'pkg/gateway/routes.go',
+]
+
+if __name__ == '__main__':
+    _handler_fixups.run(FILES)
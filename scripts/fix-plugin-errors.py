@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""Fix compile errors in pkg/plugins after the security wiring removal.
+
+The handler cleanup left plugin servers with unused fields, unused imports
+and dangling initializers. Shared pipeline in _handler_fixups.py; safe to
+re-run.
+"""
+
+import _handler_fixups
+
+PLUGIN_FILES = [
+    'pkg/plugins/api/gateway.go',
+    'pkg/plugins/auth/handler.go',
+    'pkg/plugins/auth/server.go',
+    'pkg/plugins/cache/handler.go',
+    'pkg/plugins/cache/server.go',
+    'pkg/plugins/metadata/server.go',
+    'pkg/plugins/monitor/server.go',
+    'pkg/plugins/streaming/handler.go',
+    'pkg/plugins/streaming/server.go',
+    'pkg/plugins/transcoder/handler.go',
+    'pkg/plugins/transcoder/server.go',
+    'pkg/plugins/upload/handler.go',
+    'pkg/plugins/upload/server.go',
+    'pkg/plugins/worker/handler.go',
+    'pkg/plugins/worker/server.go',
+]
+
+if __name__ == '__main__':
+    _handler_fixups.run(PLUGIN_FILES, label='plugin files')
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Remove remaining security/audit/cache references from plugin handlers.
+
+Final sweep after fix-plugin-errors.py: multi-line auditLogger.LogEvent
+calls (balanced parens), cached-response blocks and rate-limit guards that
+the single-line patterns could not express. Shared pipeline in
+_handler_fixups.py; safe to re-run.
+"""
+
+import _handler_fixups
+
+PLUGIN_FILES = [
+    'pkg/plugins/api/gateway.go',
+    'pkg/plugins/auth/handler.go',
+    'pkg/plugins/cache/handler.go',
+    'pkg/plugins/streaming/handler.go',
+    'pkg/plugins/transcoder/handler.go',
+    'pkg/plugins/upload/handler.go',
+    'pkg/plugins/worker/handler.go',
+]
+
+if __name__ == '__main__':
+    _handler_fixups.run(PLUGIN_FILES, label='plugin files')